@@ -1,35 +1,225 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import codecs
+import hashlib
 import json
+import logging
 import re
 import os
-from datetime import datetime, timezone
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# Prefer a C-implemented JSON codec when one is installed; the stdlib module
+# is the fallback so the script keeps working with no extra dependencies.
+# ensure_ascii only affects the ujson/stdlib fallbacks (it enables the
+# stdlib encoder's ASCII fast path); orjson always emits raw UTF-8.
+try:
+    import orjson
+
+    def _dumps(obj, indent: bool = False, ensure_ascii: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    _loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj, indent: bool = False, ensure_ascii: bool = False) -> bytes:
+            return ujson.dumps(obj, indent=2 if indent else 0, ensure_ascii=ensure_ascii).encode('utf-8')
+
+        _loads = ujson.loads
+    except ImportError:
+        def _dumps(obj, indent: bool = False, ensure_ascii: bool = False) -> bytes:
+            return json.dumps(obj, indent='\t' if indent else None,
+                              separators=None if indent else (',', ':'),
+                              ensure_ascii=ensure_ascii).encode('utf-8')
+
+        _loads = json.loads
+
+# NumPy is optional; when present, coordinate validation is vectorized.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# pyre2 (linear-time RE2 engine) is optional; it is only used for the
+# patterns that scan the whole multi-MB payload, where backtracking
+# worst cases hurt most. Short per-entry patterns stay on stdlib re.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = re
 
 DATA_DIR = "data"
 OUTPUT_JSON = os.path.join(DATA_DIR, "kiwisdr_locations.json")
 OUTPUT_GEOJSON = os.path.join(DATA_DIR, "kiwisdr_locations.geojson")
 OUTPUT_JS = os.path.join(DATA_DIR, "kiwisdr_com_cleaned.js")
+HASH_FILE = os.path.join(DATA_DIR, ".last_hash")
 SOURCE_URL = "https://rx.skywavelinux.com/kiwisdr_com.js"
 
+# Set KIWISDR_DEBUG=1 to log content previews while diagnosing feed issues.
+logger = logging.getLogger(__name__)
+
+# Below this many entries the per-process pickle overhead outweighs the win
+# from parallel cleaning, so small feeds stay on the sequential path.
+_PARALLEL_THRESHOLD = 5000
+
+# Patterns are compiled once at import time; several of these run per entry,
+# so going through re's module-level cache on every call adds up. Patterns
+# that scan the full payload use the RE2 backend when it is installed.
+_MISSING_COMMA_RE = _re2.compile(r'([^\s,{}\[\]])\s*([}\]])')
+_TRAILING_COMMA_RE = _re2.compile(r',(\s*[}\]])')
+_CTRL_CHARS_RE = _re2.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Deletes the same control characters as _CTRL_CHARS_RE in one C-level pass.
+_CTRL_TABLE = dict.fromkeys(
+    list(range(0x00, 0x09)) + [0x0b, 0x0c] + list(range(0x0e, 0x20)), None)
+
+# Both timestamp comments sit in the file header, so one search over a small
+# prefix replaces two scans of the whole payload. The previous per-line
+# patterns were also broken: raw-string '\\\\s*' matched a literal backslash,
+# so the timestamps always fell back to "N/A".
+_TS_RE = _re2.compile(
+    r"KiwiSDR\.com data timestamp:[ \t]*(?P<kiwi>.*)\r?\n"
+    r"(?:.*\r?\n)*?"
+    r".*[Ff]ile generation timestamp:[ \t]*(?P<gen>.*)")
+
+# How much of the file start to search for the header comments.
+_HEADER_PROBE = 4096
+
+# Matches a JSON string literal (so braces inside strings are skipped in a
+# single engine step) or a lone brace; used to bound malformed objects.
+_JSON_TOKEN_RE = _re2.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+
+def _object_end(s: str, start: int):
+    """Returns the offset just past the first balanced {...} at or after
+    `start`, or None when no balanced object remains."""
+    depth = 0
+    for m in _JSON_TOKEN_RE.finditer(s, start):
+        token = m.group()[0]
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth <= 0:
+                return m.end()
+    return None
+
+# Same idea with brackets, used to find the end of the array literal.
+_ARRAY_TOKEN_RE = _re2.compile(r'"(?:[^"\\]|\\.)*"|[\[\]]', re.DOTALL)
+
+
+def _extract_array(js_content: str):
+    """Locates the kiwisdr_com array literal and returns the '[...]' slice.
+
+    Uses str.find plus a bracket-depth token scan instead of DOTALL
+    regexes, so the payload is walked once regardless of how the
+    assignment is spelled (with or without 'var' or a trailing ';').
+    Returns None if no assignment followed by an array is found.
+    """
+    n = len(js_content)
+    idx = js_content.find('kiwisdr_com')
+    while idx != -1:
+        pos = idx + len('kiwisdr_com')
+        while pos < n and js_content[pos].isspace():
+            pos += 1
+        if pos < n and js_content[pos] == '=':
+            pos += 1
+            while pos < n and js_content[pos].isspace():
+                pos += 1
+            if pos < n and js_content[pos] == '[':
+                depth = 0
+                for m in _ARRAY_TOKEN_RE.finditer(js_content, pos):
+                    token = m.group()[0]
+                    if token == '[':
+                        depth += 1
+                    elif token == ']':
+                        depth -= 1
+                        if depth == 0:
+                            return js_content[pos:m.end()]
+                return None
+        idx = js_content.find('kiwisdr_com', idx + 1)
+    return None
+
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
+# Every field the outputs rely on, with its default. Merged under each entry
+# once in clean_entry so downstream code can index fields directly.
+_DEFAULTS = {
+    'name': 'N/A',
+    'url': '#',
+    'status': 'unknown',
+    'gps': '(0, 0)',
+    'users': 'N/A',
+    'users_max': 'N/A',
+    'loc': 'N/A',
+    'antenna': 'N/A',
+    'sw_version': 'N/A',
+    'sdr_hw': 'N/A',
+    'id': None,
+}
+
+# Fields copied from a cleaned entry into its GeoJSON feature properties.
+_PROP_KEYS = ('name', 'url', 'status', 'users', 'users_max', 'loc',
+              'antenna', 'sw_version', 'sdr_hw', 'id')
+
+# Maps Latin-1 mojibake (the only non-ASCII seen in sdr_hw in practice) and
+# tab/newline variants to plain spaces in a single C-level pass.
+_SDR_HW_TABLE = {c: ' ' for c in range(0x80, 0x100)}
+_SDR_HW_TABLE.update({0x09: ' ', 0x0a: ' ', 0x0d: ' '})
+
+def _parse_gps(gps_str: str):
+    """Parses a "(lat, lon)" string into a (float, float) tuple.
+
+    Returns None if the string is not shaped like a coordinate pair or
+    either half is not numeric.
+    """
+    s = gps_str.strip()
+    if len(s) < 5 or s[0] != '(' or s[-1] != ')':
+        return None
+    lat_str, sep, lon_str = s[1:-1].partition(',')
+    if not sep:
+        return None
+    try:
+        return float(lat_str), float(lon_str)
+    except ValueError:
+        return None
+
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Shared session: keeps the TCP/TLS connection alive across retries (and any
+# future multi-URL use) and retries transient failures with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'web-sdr-locations/1.0',
+    'Accept-Encoding': 'gzip, deflate',
+})
+_adapter = HTTPAdapter(pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
 def fetch_kiwisdr_data(url: str) -> str:
     """Fetches KiwiSDR data from the specified URL.
 
-    Tries UTF-8 decoding, falling back to latin-1 if needed.
+    Streams the body and decodes it incrementally as UTF-8, replacing any
+    undecodable bytes, so only one full-size copy of the file is held.
     Raises an exception if the request fails.
     """
     print(f"Fetching data from {url}...")
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        try:
-            content = response.content.decode('utf-8')
-        except UnicodeDecodeError:
-            print("Initial UTF-8 decoding failed, trying latin-1...")
-            content = response.content.decode('latin-1')
-        
-        print("First 500 characters of received content:")
-        print(content[:500])
+        with _SESSION.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            chunks = [decoder.decode(chunk) for chunk in response.iter_content(chunk_size=65536)]
+            chunks.append(decoder.decode(b'', final=True))
+        content = ''.join(chunks)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First 500 characters of received content:\n%s", content[:500])
         return content
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data: {e}")
@@ -41,13 +231,25 @@ def clean_json_string(json_str: str) -> str:
     This includes removing trailing commas, fixing unterminated strings,
     removing invalid escape sequences, adding missing commas before closing
     brackets/braces, and removing control characters.
+
+    Each fix runs only when a cheap probe finds something to fix, so clean
+    input (the common case for this machine-generated feed) skips the
+    substitution passes entirely.
     """
-    json_str = re.sub(r'([^\s,{}\[\]])\s*([}\]])', r'\1,\2', json_str)
-    json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-    json_str = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', '', json_str)
+    if _MISSING_COMMA_RE.search(json_str):
+        json_str = _MISSING_COMMA_RE.sub(r'\1,\2', json_str)
+    if ',' in json_str and _TRAILING_COMMA_RE.search(json_str):
+        json_str = _TRAILING_COMMA_RE.sub(r'\1', json_str)
+    if _CTRL_CHARS_RE.search(json_str):
+        json_str = json_str.translate(_CTRL_TABLE)
 
     return json_str
 
+
+# Near-identical object strings are common in the feed; the recovery loop
+# reuses cleaning results for exact duplicates instead of re-scanning.
+_clean_json_cached = lru_cache(maxsize=4096)(clean_json_string)
+
 def parse_js_data(js_content: str) -> tuple[list, str, str]:
     """Parses JavaScript content to extract data and timestamps.
 
@@ -60,115 +262,78 @@ def parse_js_data(js_content: str) -> tuple[list, str, str]:
     """
     print("Parsing JavaScript data...")
 
-    kiwi_timestamp_match = re.search(r"KiwiSDR.com data timestamp:\\s*(.*)", js_content)
-    gen_timestamp_match = re.search(r"File generation timestamp:\\s*(.*)", js_content)
-
-    kiwi_timestamp = kiwi_timestamp_match.group(1).strip() if kiwi_timestamp_match else "N/A"
-    original_gen_timestamp = gen_timestamp_match.group(1).strip() if gen_timestamp_match else "N/A"
+    ts_match = _TS_RE.search(js_content[:_HEADER_PROBE])
+    kiwi_timestamp = ts_match.group('kiwi').strip() if ts_match else "N/A"
+    original_gen_timestamp = ts_match.group('gen').strip() if ts_match else "N/A"
 
-    patterns = [
-        r"var\s+kiwisdr_com\s*=\s*(\[.*?\]);",
-        r"kiwisdr_com\s*=\s*(\[.*?\]);",
-        r"var\s+kiwisdr_com\s*=\s*(\[.*?\])",
-        r"kiwisdr_com\s*=\s*(\[.*?\])"
-    ]
-
-    json_str = None
-    for pattern in patterns:
-        match = re.search(pattern, js_content, re.DOTALL | re.MULTILINE)
-        if match:
-            json_str = match.group(1)
-            break
+    json_str = _extract_array(js_content)
 
     if json_str is None:
-        print("Could not find 'kiwisdr_com' assignment in the JavaScript file.")
-        print("Content preview:")
-        print(js_content[:1000])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Content preview:\n%s", js_content[:1000])
         raise ValueError("Could not find 'kiwisdr_com' assignment in the JavaScript file.")
 
     json_content = json_str.strip()
     if not (json_content.startswith('[') and json_content.endswith(']')):
         raise ValueError("Extracted data does not look like a JSON array (missing brackets).")
 
-    inner_content = json_content[1:-1].strip()
-
-    if not inner_content:
-        print("Parsed 0 entries (empty array).")
-        return [], kiwi_timestamp, original_gen_timestamp
+    # The feed is machine-generated and usually valid JSON, so try parsing
+    # the whole array in one C-level call before falling back to the much
+    # slower per-object recovery below.
+    try:
+        parsed_data = _loads(json_content)
+    except ValueError:
+        try:
+            parsed_data = _loads(clean_json_string(json_content))
+        except ValueError:
+            parsed_data = None
 
-    object_strs = []
-    brace_level = 0
-    current_obj_start = -1
-    in_string = False
-    escape_next = False
+    if parsed_data is not None:
+        print(f"Parsed {len(parsed_data)} entries (whole array).")
+        return parsed_data, kiwi_timestamp, original_gen_timestamp
 
-    for i, char in enumerate(inner_content):
-        if escape_next:
-            escape_next = False
-            continue
-        
-        if char == '\\':
-            escape_next = True
-            continue
-            
-        if char == '"' :
-             in_string = not in_string
-        
-        if not in_string:
-            if char == '{':
-                if brace_level == 0:
-                    current_obj_start = i
-                brace_level += 1
-            elif char == '}':
-                brace_level -= 1
-                if brace_level == 0 and current_obj_start != -1:
-                    object_strs.append(inner_content[current_obj_start : i + 1])
-                    current_obj_start = -1
-                elif brace_level < 0:
-                    print(f"Warning: Encountered closing brace without matching open brace near index {i}. Resetting.")
-                    brace_level = 0
-                    current_obj_start = -1 
+    print("Whole-array parse failed, falling back to per-object recovery...")
 
+    decoder = json.JSONDecoder()
     parsed_data = []
     success_count = 0
     fail_count = 0
+    i = 1
+    end_idx = len(json_content) - 1  # exclude the closing ']'
 
-    print(f"Attempting to parse {len(object_strs)} potential objects...")
-
-    for i, obj_str in enumerate(object_strs):
-        obj_str = obj_str.strip()
-        if not obj_str: continue
-
-        if not obj_str.startswith('{'):
-             if not re.match(r"^\\s*\\{", obj_str):
-                obj_str = '{' + obj_str
-        if not obj_str.endswith('}'):
-             if not re.search(r"\\}\\s*$", obj_str):
-                obj_str = obj_str + '}'
+    while i < end_idx:
+        while i < end_idx and json_content[i] in ' \t\n\r,':
+            i += 1
+        if i >= end_idx:
+            break
 
-        if not (obj_str.startswith('{') and obj_str.endswith('}')):
-            print(f"Skipping malformed segment #{i+1}: Not a valid object structure ...{obj_str[:100]}...")
-            fail_count += 1
+        # Valid objects parse in one C-level raw_decode call that also
+        # reports where the next object starts.
+        try:
+            data_item, i = decoder.raw_decode(json_content, i)
+            parsed_data.append(data_item)
+            success_count += 1
             continue
+        except ValueError:
+            pass
 
+        # Malformed object: bound it with the token scanner, attempt a
+        # cleaned re-parse, and continue past it either way.
+        obj_end = _object_end(json_content, i)
+        if obj_end is None:
+            break
+        obj_str = json_content[i:obj_end].strip()
+        i = obj_end
+        if not obj_str:
+            continue
         try:
-            cleaned_obj_str = clean_json_string(obj_str)
-            data_item = json.loads(cleaned_obj_str)
-            parsed_data.append(data_item)
+            parsed_data.append(_loads(_clean_json_cached(obj_str)))
             success_count += 1
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             fail_count += 1
-            print(f"Failed to parse object #{i+1}: {e}")
-            error_pos = getattr(e, 'pos', 0)
-            start = max(0, error_pos - 40)
-            end = min(len(cleaned_obj_str), error_pos + 40)
-            context = cleaned_obj_str[start:end].replace('\\n', ' ')
-            print(f"Context: ...{context}...")
-        except Exception as e:
-             fail_count += 1
-             print(f"Unexpected error parsing object #{i+1}: {e}")
-             print(f"Problematic object string: ...{obj_str[:200]}...")
-
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Failed to parse object #%d: %s", success_count + fail_count, e)
+                logger.debug("Problematic object string: ...%s...", obj_str[:200])
 
     print(f"Finished parsing: Successfully parsed {success_count} entries, failed/skipped {fail_count} entries.")
     return parsed_data, kiwi_timestamp, original_gen_timestamp
@@ -177,37 +342,109 @@ def clean_entry(entry: dict) -> dict:
     """Cleans specific fields within a KiwiSDR entry.
 
     Specifically cleans the 'sdr_hw' and 'name' fields.
-    Ensures essential fields ('name', 'url', 'status', 'gps') exist,
-    providing defaults if necessary.
+    Ensures every field listed in _DEFAULTS exists, providing defaults
+    if necessary, so downstream code can index fields directly.
     """
     if 'sdr_hw' in entry:
         hw_str = entry['sdr_hw']
-        
-        patterns = [
-            (r'[^\x00-\x7F]+', ' '),
-            (r'\s+', ' '),
-            (r'GPS\s*\|', 'GPS |'),
-            (r'Limits\s*\|', 'Limits |'),
-            (r'\|\s*$', ''),
-            (r'^\s*\|', ''),
-        ]
-        
-        for pattern, replacement in patterns:
-            hw_str = re.sub(pattern, replacement, hw_str)
-        
-        hw_str = hw_str.strip()
-        entry['sdr_hw'] = hw_str
+        # str.isascii is a single early-exit C scan; purely ASCII strings
+        # (the common case) skip the translation passes entirely. Any ASCII
+        # whitespace the table would have mapped is handled by the collapse.
+        if not hw_str.isascii():
+            hw_str = hw_str.translate(_SDR_HW_TABLE)
+            if not hw_str.isascii():
+                hw_str = _NON_ASCII_RE.sub(' ', hw_str)
+        # str.split() with no argument splits on whitespace runs and drops
+        # leading/trailing ones, so join+strip matches the old regex collapse.
+        entry['sdr_hw'] = ' '.join(hw_str.split()).strip(' |')
 
     if 'name' in entry:
-        entry['name'] = re.sub(r'\s+', ' ', entry['name']).strip()
+        entry['name'] = ' '.join(entry['name'].split())
 
-    entry.setdefault('name', 'N/A')
-    entry.setdefault('url', '#')
-    entry.setdefault('status', 'unknown')
-    entry.setdefault('gps', '(0, 0)')
+    # Entries from the feed carry nearly all fields already, so testing
+    # membership and filling only the gaps beats rebuilding a merged dict
+    # per entry (and keeps the feed's own key order).
+    for key, value in _DEFAULTS.items():
+        if key not in entry:
+            entry[key] = value
 
     return entry
 
+def _make_feature(entry: dict, lat: float, lon: float) -> dict:
+    """Builds a GeoJSON Feature dict for a cleaned entry and its coordinates."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [lon, lat]
+        },
+        "properties": {k: entry[k] for k in _PROP_KEYS}
+    }
+
+
+def _entry_to_feature(entry: dict):
+    """Builds the feature for a cleaned entry, or None if GPS is missing/invalid."""
+    coord = _parse_gps(entry['gps'])
+    if coord is None:
+        return None
+    lat, lon = coord
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return _make_feature(entry, lat, lon)
+
+
+def _dedupe_by_id(data: list) -> list:
+    """Drops entries whose 'id' was already seen, keeping the first.
+
+    The recovery parser admits repeated objects silently, so duplicates
+    would otherwise be cleaned and featurized twice and land twice in the
+    outputs. Entries without an id are always kept.
+    """
+    seen = set()
+    seen_add = seen.add
+    deduped = []
+    deduped_append = deduped.append
+    for entry in data:
+        eid = entry.get('id')
+        if eid is not None:
+            if eid in seen:
+                continue
+            seen_add(eid)
+        deduped_append(entry)
+    if len(deduped) != len(data):
+        print(f"Dropped {len(data) - len(deduped)} duplicate entries by id.")
+    return deduped
+
+
+def clean_and_featurize(data: list) -> tuple[list, dict]:
+    """Cleans entries and builds the GeoJSON FeatureCollection in one pass.
+
+    Walking the list once keeps each entry hot in cache between cleaning
+    and feature construction. Returns (cleaned_entries, feature_collection).
+    """
+    cleaned = []
+    features = []
+    cleaned_append = cleaned.append
+    features_append = features.append
+    for entry in data:
+        entry = clean_entry(entry)
+        cleaned_append(entry)
+        feature = _entry_to_feature(entry)
+        if feature is not None:
+            features_append(feature)
+    return cleaned, {"type": "FeatureCollection", "features": features}
+
+
+def _process_chunk(entries: list) -> tuple[list, list]:
+    """Cleans a slice of raw entries and builds their GeoJSON features.
+
+    Worker for the parallel path in __main__; returns (cleaned, features).
+    """
+    cleaned = [clean_entry(e) for e in entries]
+    features = [f for f in map(_entry_to_feature, cleaned) if f is not None]
+    return cleaned, features
+
+
 def create_geojson(data: list) -> dict:
     """Converts cleaned data into a GeoJSON FeatureCollection.
 
@@ -216,111 +453,139 @@ def create_geojson(data: list) -> dict:
     Returns a GeoJSON FeatureCollection dictionary.
     """
     print("Creating GeoJSON...")
-    features = []
+    # Upper-bounded by len(data); preallocating skips the geometric list
+    # growth and the tail is trimmed after the loop.
+    features = [None] * len(data)
     processed_count = 0
     skipped_count = 0
-    for entry in data:
-        gps_match = re.match(r"\(\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*\)", entry.get('gps', ''))
-        if gps_match:
-            try:
-                lat = float(gps_match.group(1))
-                lon = float(gps_match.group(2))
-
-                if -90 <= lat <= 90 and -180 <= lon <= 180:
-                    feature = {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "Point",
-                            "coordinates": [lon, lat]
-                        },
-                        "properties": {
-                            "name": entry.get('name', 'N/A'),
-                            "url": entry.get('url', '#'),
-                            "status": entry.get('status', 'unknown'),
-                            "users": entry.get('users', 'N/A'),
-                            "users_max": entry.get('users_max', 'N/A'),
-                            "loc": entry.get('loc', 'N/A'),
-                            "antenna": entry.get('antenna', 'N/A'),
-                            "sw_version": entry.get('sw_version', 'N/A'),
-                            "sdr_hw": entry.get('sdr_hw', 'N/A'),
-                            "id": entry.get('id')
-                        }
-                    }
-                    features.append(feature)
-                    processed_count += 1
-                else:
-                    print(f"Skipping entry '{entry.get('name', entry.get('id'))}' due to invalid coordinates: ({lat}, {lon})")
-                    skipped_count += 1
-            except ValueError:
-                print(f"Skipping entry '{entry.get('name', entry.get('id'))}' due to non-numeric GPS part: {entry.get('gps')}")
-                skipped_count += 1
+    out_of_range_count = 0
+    coords = [_parse_gps(entry.get('gps', '')) for entry in data]
+    if np is not None and coords:
+        nan = float('nan')
+        lats = np.fromiter((c[0] if c is not None else nan for c in coords),
+                           dtype=np.float64, count=len(coords))
+        lons = np.fromiter((c[1] if c is not None else nan for c in coords),
+                           dtype=np.float64, count=len(coords))
+        valid = ((np.abs(lats) <= 90.0) & (np.abs(lons) <= 180.0)).tolist()
+    else:
+        valid = [c is not None and -90 <= c[0] <= 90 and -180 <= c[1] <= 180
+                 for c in coords]
+
+    for entry, coord, ok in zip(data, coords, valid):
+        if ok:
+            lat, lon = coord
+            features[processed_count] = _make_feature(entry, lat, lon)
+            processed_count += 1
         else:
+            if coord is not None:
+                out_of_range_count += 1
+                logger.debug("Skipping entry '%s' due to invalid coordinates: (%s, %s)",
+                             entry.get('name', entry.get('id')), coord[0], coord[1])
             skipped_count += 1
 
-    print(f"GeoJSON: Processed {processed_count} entries, skipped {skipped_count} due to missing/invalid GPS.")
+    del features[processed_count:]
+    print(f"GeoJSON: Processed {processed_count} entries, skipped {skipped_count} "
+          f"due to missing/invalid GPS ({out_of_range_count} out of range).")
     return {
         "type": "FeatureCollection",
         "features": features
     }
 
-def write_json(filepath: str, data: list):
-    """Writes data to a JSON file with tabs for indentation."""
+def write_json(filepath: str, json_blob: bytes):
+    """Writes an already-serialized JSON document to a file."""
     print(f"Writing JSON data to {filepath}...")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent='\t', ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(json_blob)
     print("JSON writing complete.")
 
 def write_geojson(filepath: str, geojson_data: dict):
     """Writes GeoJSON data to a file."""
     print(f"Writing GeoJSON data to {filepath}...")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(geojson_data, f, ensure_ascii=False)
+    with open(filepath, 'wb') as f:
+        f.write(_dumps(geojson_data, ensure_ascii=True))
     print("GeoJSON writing complete.")
 
-def write_js(filepath: str, data: list, kiwi_ts: str, original_gen_ts: str):
-    """Writes data back into JavaScript variable format with headers.
+def write_js(filepath: str, json_blob: bytes, kiwi_ts: str, original_gen_ts: str):
+    """Writes serialized data back into JavaScript variable format with headers.
 
     Includes timestamps for KiwiSDR data, original file generation, and
     current file generation.
     """
     print(f"Writing cleaned JS data to {filepath}...")
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-    current_time_gmt = datetime.now(timezone.utc).strftime("%A, %d-%b-%Y %H:%M:%S GMT")
-    current_time_local = datetime.now().strftime("%a %b %d %H:%M:%S %Y")
+    now = time.time()
+    current_time_gmt = time.strftime("%A, %d-%b-%Y %H:%M:%S GMT", time.gmtime(now))
+    current_time_local = time.strftime("%a %b %d %H:%M:%S %Y", time.localtime(now))
 
-    json_string = json.dumps(data, indent='\t', ensure_ascii=False)
-
-    js_output = f"""// KiwiSDR.com receiver list
+    header = f"""// KiwiSDR.com receiver list
 // Automatically generated from {SOURCE_URL}
 // KiwiSDR.com data timestamp: {kiwi_ts}
 // Original file generation timestamp: {original_gen_ts}
 // This file generation timestamp: {current_time_local} ({current_time_gmt})
 
 var kiwisdr_com =
-{json_string};
 """
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(js_output)
+    with open(filepath, 'wb') as f:
+        f.write(header.encode('utf-8'))
+        f.write(json_blob)
+        f.write(b';\n')
     print("JS writing complete.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get('KIWISDR_DEBUG') else logging.INFO,
+        format='%(message)s')
     try:
         js_content = fetch_kiwisdr_data(SOURCE_URL)
+
+        # Scheduled runs usually see an unchanged upstream file; comparing a
+        # digest against the previous run skips all parsing and rewriting.
+        content_hash = hashlib.blake2b(
+            js_content.encode('utf-8', 'replace'), digest_size=16).hexdigest()
+        try:
+            with open(HASH_FILE, 'r', encoding='utf-8') as f:
+                last_hash = f.read().strip()
+        except OSError:
+            last_hash = None
+        outputs_present = all(
+            os.path.exists(p) for p in (OUTPUT_JSON, OUTPUT_GEOJSON, OUTPUT_JS))
+        if content_hash == last_hash and outputs_present:
+            print("Upstream data unchanged since last run; outputs are up to date.")
+            sys.exit(0)
+
         raw_data, kiwi_timestamp, original_gen_timestamp = parse_js_data(js_content)
+        raw_data = _dedupe_by_id(raw_data)
 
         print("Cleaning data entries...")
-        cleaned_data = [clean_entry(entry) for entry in raw_data]
+        ncpu = os.cpu_count() or 1
+        if len(raw_data) >= _PARALLEL_THRESHOLD and ncpu > 1:
+            # Cleaning and feature building are CPU-bound and hold the GIL,
+            # so large feeds are split across worker processes.
+            chunk_size = -(-len(raw_data) // ncpu)
+            chunks = [raw_data[i:i + chunk_size] for i in range(0, len(raw_data), chunk_size)]
+            cleaned_data = []
+            features = []
+            with ProcessPoolExecutor() as executor:
+                for chunk_cleaned, chunk_features in executor.map(_process_chunk, chunks):
+                    cleaned_data.extend(chunk_cleaned)
+                    features.extend(chunk_features)
+            geojson_data = {"type": "FeatureCollection", "features": features}
+        else:
+            cleaned_data, geojson_data = clean_and_featurize(raw_data)
         print("Cleaning complete.")
 
-        write_json(OUTPUT_JSON, cleaned_data)
+        # Serialize once; the JSON and JS outputs embed the same document.
+        # Both are machine-read, so compact encoding (the encoder's fast
+        # path) beats pretty-printing for size and speed.
+        json_blob = _dumps(cleaned_data)
+        write_json(OUTPUT_JSON, json_blob)
 
-        geojson_data = create_geojson(cleaned_data)
         write_geojson(OUTPUT_GEOJSON, geojson_data)
 
-        write_js(OUTPUT_JS, cleaned_data, kiwi_timestamp, original_gen_timestamp)
+        write_js(OUTPUT_JS, json_blob, kiwi_timestamp, original_gen_timestamp)
+
+        with open(HASH_FILE, 'w', encoding='utf-8') as f:
+            f.write(content_hash)
 
         print("\nProcessing finished successfully!")
 